@@ -2,7 +2,7 @@ import asyncio
 import logging
 import os
 import sys
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Coroutine
 from contextlib import asynccontextmanager
 from functools import partial
 from importlib.metadata import version as get_pkg_version
@@ -88,6 +88,18 @@ def create_arcade_app() -> fastapi.FastAPI:
     return app
 
 
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine on uvloop when it is installed, else on the default asyncio loop."""
+    try:
+        from uvloop import run as _run
+    except ImportError:
+        # Also covers uvloop releases before 0.18, which have no uvloop.run.
+        # asyncio.run has no loop_factory keyword, hence the ignore when uvloop is installed.
+        _run = asyncio.run  # type: ignore[assignment,unused-ignore]
+
+    _run(main)
+
+
 def _run_mcp_stdio(
     toolkits: list[Toolkit], *, logging_enabled: bool, env_file: str | None = None
 ) -> None:
@@ -117,7 +129,7 @@ def _run_mcp_stdio(
     )
 
     try:
-        asyncio.run(server.run())
+        _run_event_loop(server.run())
     except KeyboardInterrupt:
         logger.info("MCP server stopped by user.")
     except Exception as exc:
@@ -166,7 +166,7 @@ class BaseWorker(Worker):
         return ToolCallResponse(
             execution_id=execution_id,
             duration=duration_ms,
-            finished_at=datetime.now().isoformat(),
+            finished_at=datetime.fromtimestamp(end_time).isoformat(),
             success=not output.error,
             output=output,
         )
@@ -1,9 +1,9 @@
-import json
 from typing import Any, Callable
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from opentelemetry.metrics import Meter
+from pydantic_core import from_json
 
 from arcade_serve.core.base import (
     BaseWorker,
@@ -75,8 +75,8 @@ class FastAPIRouter(Router):
             if use_auth_for_route
             else None,
         ) -> Any:
-            body_str = await request.body()
-            body_json = json.loads(body_str) if body_str else {}
+            body = await request.body()
+            body_json = from_json(body) if body else {}
             request_data = RequestData(
                 path=request.url.path,
                 method=request.method,
@@ -13,6 +13,21 @@ from arcade_serve.mcp.types import (
 
 logger = logging.getLogger("arcade.mcp")
 
+# Python and MCP (RFC 5424 severity) log level names mapped to Python logging levels
+LOG_LEVELS: dict[str, int] = {
+    "notset": logging.NOTSET,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+    "alert": logging.CRITICAL,
+    "emergency": logging.CRITICAL,
+}
+
 
 class MCPLoggingMiddleware:
     """
@@ -33,14 +48,20 @@ class MCPLoggingMiddleware:
         Initialize the MCP logging middleware.
 
         Args:
-            log_level: Logging level (default: "INFO").
+            log_level: Logging level, Python or MCP level name (default: "INFO").
             log_request_body: Whether to log full request bodies (default: False).
             log_response_body: Whether to log full response bodies (default: False).
             log_errors: Whether to log errors at ERROR level (default: True).
             min_duration_to_log_ms: Minimum duration in ms to log (0 logs all).
             stdio_mode: Whether running in stdio mode (redirects logs to stderr).
+
+        Raises:
+            ValueError: If log_level is not a known level name.
         """
-        self.log_level = getattr(logging, log_level.upper())
+        try:
+            self.log_level = LOG_LEVELS[log_level.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown log level: {log_level}") from None
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
         self.log_errors = log_errors
@@ -95,7 +116,7 @@ class MCPLoggingMiddleware:
         Log an MCP request message.
         """
         if not isinstance(message, JSONRPCRequest):
-            logger.debug(f"Ignoring non-request message: {type(message).__name__}")
+            logger.debug("Ignoring non-request message: %s", type(message).__name__)
             return
 
         try:
@@ -120,7 +141,7 @@ class MCPLoggingMiddleware:
         Log an MCP response message.
         """
         if not isinstance(message, (JSONRPCResponse, JSONRPCError)):
-            logger.debug(f"Ignoring non-response message: {type(message).__name__}")
+            logger.debug("Ignoring non-response message: %s", type(message).__name__)
             return
 
         try:
@@ -1,9 +1,22 @@
 import inspect
-import json
 import logging
 from typing import Any, Callable, TypeVar
 
-from arcade_serve.mcp.types import InitializeRequest, JSONRPCRequest, MCPMessage
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from arcade_serve.mcp.types import (
+    CallToolRequest,
+    CancelRequest,
+    InitializeRequest,
+    JSONRPCRequest,
+    ListPromptsRequest,
+    ListResourcesRequest,
+    ListToolsRequest,
+    MCPMessage,
+    PingRequest,
+    ShutdownRequest,
+)
 
 logger = logging.getLogger("arcade.mcp")
 
@@ -12,6 +25,18 @@ T = TypeVar("T")
 # Type definition for middleware functions
 MessageProcessor = Callable[[Any, str], Any]
 
+# Request model for each known method, so a request is validated once into its own type
+REQUEST_TYPES: dict[str, type[JSONRPCRequest]] = {
+    "initialize": InitializeRequest,
+    "ping": PingRequest,
+    "tools/list": ListToolsRequest,
+    "tools/call": CallToolRequest,
+    "$/cancelRequest": CancelRequest,
+    "shutdown": ShutdownRequest,
+    "resources/list": ListResourcesRequest,
+    "prompts/list": ListPromptsRequest,
+}
+
 
 class MCPMessageProcessor:
     """
@@ -20,10 +45,11 @@ class MCPMessageProcessor:
     """
 
     def __init__(self) -> None:
-        self.middleware: list[Callable[[MCPMessage, str], Any]] = []
+        # Middleware paired with whether it must be awaited, resolved once when added
+        self.middleware: list[tuple[Callable[[MCPMessage, str], Any], bool]] = []
 
     def add_middleware(self, mw: Callable[[MCPMessage, str], Any]) -> None:
-        self.middleware.append(mw)
+        self.middleware.append((mw, inspect.iscoroutinefunction(mw)))
 
     async def process(self, message: Any, direction: str) -> Any:  # noqa: C901
         # First, try to parse the message if it's a string
@@ -34,33 +60,40 @@ class MCPMessageProcessor:
                 return None
 
             try:
-                parsed = json.loads(message)
+                parsed = from_json(message)
+            except (ValueError, TypeError):
+                # TypeError covers text that cannot be encoded as UTF-8 (lone surrogates)
+                logger.warning(f"Failed to parse message as JSON: {message[:100]}...")
+                parsed = None
+
+            try:
                 if isinstance(parsed, dict):
                     method = parsed.get("method")
                     # Convert to appropriate message type
-                    if method == "initialize" and "id" in parsed:
-                        logger.debug(f"Parsed initialize request: {parsed}")
-                        message = InitializeRequest(**parsed)
-                    elif method and method.startswith("notifications/"):
+                    if method and method.startswith("notifications/"):
                         # It's a notification, log it but pass through as dict
-                        logger.debug(f"Received notification: {method}")
+                        logger.debug("Received notification: %s", method)
                         # Keep as parsed dict to avoid validation errors on unknown notifications
                         message = parsed
                     elif "method" in parsed and "id" in parsed:
-                        # Regular method request
-                        logger.debug(f"Parsed method request: {method}")
-                        message = JSONRPCRequest(**parsed)
+                        # Regular method request, typed by its method when known
+                        logger.debug("Parsed method request: %s", method)
+                        request_type = REQUEST_TYPES.get(parsed["method"], JSONRPCRequest)
+                        try:
+                            message = request_type.model_validate(parsed)
+                        except ValidationError:
+                            # Method models are stricter (e.g. required params), so fall
+                            # back to a generic request rather than echoing the raw text
+                            message = JSONRPCRequest.model_validate(parsed)
                     # Other message types can be handled similarly
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse message as JSON: {message[:100]}...")
             except Exception:
                 logger.exception("Error processing message")
 
         # Process through middleware chain
         result = message
-        for mw in self.middleware:
+        for mw, is_async in self.middleware:
             try:
-                if inspect.iscoroutinefunction(mw):
+                if is_async:
                     result = await mw(result, direction)
                 else:
                     result = mw(result, direction)
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import os
-import uuid
+import time
 from enum import Enum
 from typing import Any, Callable, Union
 
@@ -16,6 +16,8 @@ from arcade_serve.mcp.convert import convert_to_mcp_content, create_mcp_tool
 from arcade_serve.mcp.logging import create_mcp_logging_middleware
 from arcade_serve.mcp.message_processor import MCPMessageProcessor, create_message_processor
 from arcade_serve.mcp.types import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
     CallToolRequest,
     CallToolResponse,
     CallToolResult,
@@ -46,6 +48,27 @@ logger = logging.getLogger("arcade.mcp")
 
 MCP_PROTOCOL_VERSION = "2024-11-05"
 
+# How long a completed authorization is reused before asking Arcade again
+AUTH_CACHE_TTL_SECONDS = 300
+
+# The server's capabilities and identity never change, so the initialize result
+# is built once and shared by every connection.
+_INITIALIZE_RESULT = InitializeResult(
+    protocolVersion=MCP_PROTOCOL_VERSION,
+    capabilities=ServerCapabilities(),
+    serverInfo=Implementation(name="Arcade MCP Worker", version="0.1.0"),
+    instructions="Arcade MCP Worker initialized.",
+)
+
+# Constant error payloads, shared across responses and never mutated
+_LIST_TOOLS_ERROR: dict[str, Any] = {
+    "code": INTERNAL_ERROR,
+    "message": "Internal error listing tools",
+}
+
+# Sentinel for lazily resolved values that may legitimately resolve to None
+_UNRESOLVED = object()
+
 
 class MessageMethod(str, Enum):
     """Enumeration of supported MCP message methods"""
@@ -99,6 +122,15 @@ class MCPServer:
         # Initialize AsyncArcade with the *remaining* client_kwargs
         self.arcade = AsyncArcade(**client_kwargs)  # type: ignore[arg-type]
 
+        # Completed authorizations keyed by (provider_id, provider_type, user_id, scopes)
+        self._auth_cache: dict[tuple, tuple[float, AuthorizationResponse]] = {}
+
+        # Catalog tool and auth requirement per MCP tool name, resolved on first call
+        self._resolved_tools: dict[str, tuple[MaterializedTool, AuthRequirement | None]] = {}
+
+        # Email of the logged in Arcade user, resolved on first connection
+        self._config_user_id: str | object | None = _UNRESOLVED
+
         # Initialize handler dispatch table
         self._method_handlers: dict[str, Callable] = {
             MessageMethod.PING: self._handle_ping,
@@ -157,24 +189,42 @@ class MCPServer:
         Returns:
             A user ID string
         """
-        try:
-            from arcade_core.config import config
-
-            # Prefer config.user.email if available
-            if config.user and config.user.email:
-                return config.user.email
-        except ValueError:
-            logger.debug("No logged in user for MCP Server")
-
-        fallback = str(uuid.uuid4())
-        if os.environ.get("ARCADE_USER_ID", None):
-            return os.environ.get("ARCADE_USER_ID", fallback)
-        elif isinstance(init_options, dict):
+        env_user_id = os.environ.get("ARCADE_USER_ID")
+        if env_user_id:
+            return env_user_id
+
+        if isinstance(init_options, dict):
             user_id = init_options.get("user_id")
             if user_id:
                 return str(user_id)
-        # Fallback to random UUID
-        return str(fallback)
+
+        config_user_id = self._get_config_user_id()
+        if config_user_id:
+            return config_user_id
+
+        # Fallback to an opaque random ID
+        return os.urandom(16).hex()
+
+    def _get_config_user_id(self) -> str | None:
+        """
+        Get the email of the logged in Arcade user, if any.
+
+        Loading the config reads the credentials file (and raises if there is none),
+        so the outcome is resolved once and cached for the lifetime of the server.
+
+        Returns:
+            The logged in user's email, or None if no user is logged in
+        """
+        if self._config_user_id is _UNRESOLVED:
+            self._config_user_id = None
+            try:
+                from arcade_core.config import config
+
+                if config.user and config.user.email:
+                    self._config_user_id = config.user.email
+            except ValueError:
+                logger.debug("No logged in user for MCP Server")
+        return self._config_user_id  # type: ignore[return-value]
 
     async def _send_response(self, write_stream: Any, response: Any) -> None:
         """
@@ -186,22 +236,17 @@ class MCPServer:
         """
         # Ensure the response is properly serialized to JSON
         if hasattr(response, "model_dump_json"):
-            # It's a Pydantic model, serialize it
-            json_response = response.model_dump_json()
-            # Ensure it ends with a newline for JSON-RPC-over-stdio
-            if not json_response.endswith("\n"):
-                json_response += "\n"
-            logger.debug(f"Sending response: {json_response[:200]}...")
+            # It's a Pydantic model, serialize it. Serialized JSON never ends with
+            # a newline, so terminate it for JSON-RPC-over-stdio unconditionally.
+            json_response = response.model_dump_json() + "\n"
+            logger.debug("Sending response: %.200s...", json_response)
             await write_stream.send(json_response)
         elif isinstance(response, dict):
             # It's a dict, convert to JSON
             import json
 
-            json_response = json.dumps(response)
-            # Ensure it ends with a newline for JSON-RPC-over-stdio
-            if not json_response.endswith("\n"):
-                json_response += "\n"
-            logger.debug(f"Sending response: {json_response[:200]}...")
+            json_response = json.dumps(response) + "\n"
+            logger.debug("Sending response: %.200s...", json_response)
             await write_stream.send(json_response)
         else:
             # It's already a string or something else
@@ -209,7 +254,7 @@ class MCPServer:
             # Ensure it ends with a newline for JSON-RPC-over-stdio
             if not response_str.endswith("\n"):
                 response_str += "\n"
-            logger.debug(f"Sending raw response type: {type(response)}")
+            logger.debug("Sending raw response type: %s", type(response))
             await write_stream.send(response_str)
 
     async def handle_message(self, message: Any, user_id: str | None = None) -> Any:
@@ -246,34 +291,34 @@ class MCPServer:
                 # Not parseable JSON, continue with normal processing
                 pass
 
-        # Check if it's a notification
-        if hasattr(processed, "method"):
+        # Notifications are kept as parsed dicts by the message processor
+        if isinstance(processed, dict):
+            method = processed.get("method")
+        else:
             method = getattr(processed, "method", None)
 
-            # Handle notifications (methods starting with "notifications/")
-            if method and method.startswith("notifications/"):
-                await self._handle_notification(method, processed)
-                return None
+        # If it's not a method request, just pass it through
+        if not method:
+            return processed
 
-            # Handle regular methods using the dispatch table
-            if method in self._method_handlers:
-                # If it's a call_tool request, we need to pass the user_id
-                if method == MessageMethod.CALL_TOOL:
-                    return await self._method_handlers[method](processed, user_id=user_id)
-                # For other methods, just pass the processed message
-                return await self._method_handlers[method](processed)
+        # Handle notifications (methods starting with "notifications/")
+        if method.startswith("notifications/"):
+            await self._handle_notification(method, processed)
+            return None
 
-            # Unknown method
+        # Handle regular methods using the dispatch table
+        handler = self._method_handlers.get(method)
+        if handler is None:
             return JSONRPCError(
                 id=getattr(processed, "id", None),
-                error={
-                    "code": -32601,
-                    "message": f"Method not found: {method}",
-                },
+                error={"code": METHOD_NOT_FOUND, "message": f"Method not found: {method}"},
             )
 
-        # If it's not a method request, just pass it through
-        return processed
+        # If it's a call_tool request, we need to pass the user_id
+        if method == MessageMethod.CALL_TOOL:
+            return await handler(processed, user_id=user_id)
+        # For other methods, just pass the processed message
+        return await handler(processed)
 
     async def _handle_notification(self, method: str, message: Any) -> None:
         """
@@ -284,9 +329,13 @@ class MCPServer:
             message: The notification message
         """
         if method == "notifications/cancelled":
-            logger.info(f"Request cancelled: {getattr(message, 'params', {})}")
+            if isinstance(message, dict):
+                params = message.get("params", {})
+            else:
+                params = getattr(message, "params", {})
+            logger.info(f"Request cancelled: {params}")
         else:
-            logger.debug(f"Received notification: {method}")
+            logger.debug("Received notification: %s", method)
 
     async def _handle_ping(self, message: PingRequest) -> PingResponse:
         """
@@ -298,7 +347,7 @@ class MCPServer:
         Returns:
             A properly formatted pong response
         """
-        return PingResponse(id=message.id)
+        return PingResponse.model_construct(id=message.id, result={"pong": True})
 
     async def _handle_initialize(self, message: InitializeRequest) -> InitializeResponse:
         """
@@ -310,18 +359,11 @@ class MCPServer:
         Returns:
             A properly formatted initialize response
         """
-        # Create the result data
-        result = InitializeResult(
-            protocolVersion=MCP_PROTOCOL_VERSION,
-            capabilities=ServerCapabilities(),
-            serverInfo=Implementation(name="Arcade MCP Worker", version="0.1.0"),
-            instructions="Arcade MCP Worker initialized.",
-        )
-
         # Construct proper response with result field
-        response = InitializeResponse(id=message.id, result=result)
+        response = InitializeResponse(id=message.id, result=_INITIALIZE_RESULT)
 
-        logger.debug(f"Initialize response: {response.model_dump_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initialize response: %s", response.model_dump_json())
         return response
 
     async def _handle_list_tools(
@@ -376,13 +418,7 @@ class MCPServer:
 
         except Exception:
             logger.exception("Error listing tools")
-            return JSONRPCError(
-                id=message.id,
-                error={
-                    "code": -32603,
-                    "message": "Internal error listing tools",
-                },
-            )
+            return JSONRPCError(id=message.id, error=_LIST_TOOLS_ERROR)
         return response
 
     async def _handle_call_tool(
@@ -398,16 +434,17 @@ class MCPServer:
         Returns:
             A properly formatted tools/call response
         """
-        tool_name: str = message.params["name"]
-        # Extract input from the correct field
-        input_params: dict[str, Any] = message.params.get("input", {})
-        if not input_params:
-            input_params = message.params.get("arguments", {})
+        # Responses are built from server-generated content, so they are constructed
+        # without validation; validation is reserved for incoming messages.
+        params = message.params
+        tool_name: str = params["name"]
+        # Extract input from the correct field ("input", falling back to MCP's "arguments")
+        input_params: dict[str, Any] = params.get("input") or params.get("arguments") or {}
 
         logger.info(f"Handling tool call for {tool_name}")
 
         try:
-            tool = self.tool_catalog.get_tool_by_name(tool_name, separator="_")
+            tool, requirement = self._resolve_tool(tool_name)
             tool_context = ToolContext()
 
             # Set up context with secrets
@@ -415,13 +452,14 @@ class MCPServer:
                 self._setup_tool_secrets(tool, tool_context)
 
             # Handle authorization if needed
-            requirement = self._get_auth_requirement(tool)
             if requirement:
                 auth_result = await self._check_authorization(requirement, user_id=user_id)
                 if auth_result.status != "completed":
-                    return CallToolResponse(
+                    return CallToolResponse.model_construct(
                         id=message.id,
-                        result=CallToolResult(content=[{"type": "text", "text": auth_result.url}]),
+                        result=CallToolResult.model_construct(
+                            content=[{"type": "text", "text": auth_result.url}]
+                        ),
                     )
                 else:
                     tool_context.authorization = ToolAuthorizationContext(
@@ -430,7 +468,7 @@ class MCPServer:
                     )
 
             # Execute the tool
-            logger.debug(f"Executing tool {tool_name} with input: {input_params}")
+            logger.debug("Executing tool %s with input: %s", tool_name, input_params)
             result = await ToolExecutor.run(
                 func=tool.tool,
                 definition=tool.definition,
@@ -439,31 +477,56 @@ class MCPServer:
                 context=tool_context,
                 **input_params,
             )
-            logger.debug(f"Tool result: {result}")
+            logger.debug("Tool result: %s", result)
             if result.value:
-                return CallToolResponse(
+                return CallToolResponse.model_construct(
                     id=message.id,
-                    result=CallToolResult(content=convert_to_mcp_content(result.value)),
+                    result=CallToolResult.model_construct(
+                        content=convert_to_mcp_content(result.value)
+                    ),
                 )
             else:
                 error = result.error or "Error calling tool"
                 logger.error(f"Tool {tool_name} returned error: {error}")
-                return CallToolResponse(
+                return CallToolResponse.model_construct(
                     id=message.id,
-                    result=CallToolResult(
+                    result=CallToolResult.model_construct(
                         content=[{"type": "text", "text": convert_to_mcp_content(error)}]
                     ),
                 )
         except Exception as e:
             logger.exception(f"Error calling tool {tool_name}")
             error = f"Error calling tool {tool_name}: {e!s}"
-            return CallToolResponse(
+            return CallToolResponse.model_construct(
                 id=message.id,
-                result=CallToolResult(
+                result=CallToolResult.model_construct(
                     content=[{"type": "text", "text": convert_to_mcp_content(error)}]
                 ),
             )
 
+    def _resolve_tool(self, tool_name: str) -> tuple[MaterializedTool, AuthRequirement | None]:
+        """
+        Look up a tool and its authorization requirement by MCP tool name.
+
+        Both are fixed for the lifetime of the catalog, so they are resolved once
+        per tool and reused across calls.
+
+        Args:
+            tool_name: The MCP tool name (toolkit and tool joined by "_")
+
+        Returns:
+            The materialized tool and its authorization requirement, if any
+
+        Raises:
+            ValueError: If the tool is not found in the catalog
+        """
+        resolved = self._resolved_tools.get(tool_name)
+        if resolved is None:
+            tool = self.tool_catalog.get_tool_by_name(tool_name, separator="_")
+            resolved = (tool, self._get_auth_requirement(tool))
+            self._resolved_tools[tool_name] = resolved
+        return resolved
+
     def _setup_tool_secrets(self, tool: Any, tool_context: ToolContext) -> None:
         """
         Set up tool secrets in the tool context.
@@ -487,7 +550,7 @@ class MCPServer:
         Returns:
             A response acknowledging the notification
         """
-        return JSONRPCResponse(id=getattr(message, "id", None), result={"ok": True})
+        return JSONRPCResponse.model_construct(id=getattr(message, "id", None), result={"ok": True})
 
     async def _handle_cancel(self, message: CancelRequest) -> JSONRPCResponse:
         """
@@ -499,7 +562,7 @@ class MCPServer:
         Returns:
             A response acknowledging the cancellation
         """
-        return JSONRPCResponse(id=getattr(message, "id", None), result={"ok": True})
+        return JSONRPCResponse.model_construct(id=getattr(message, "id", None), result={"ok": True})
 
     async def _handle_shutdown(self, message: ShutdownRequest) -> ShutdownResponse:
         """
@@ -526,7 +589,7 @@ class MCPServer:
         Returns:
             A properly formatted resources/list response
         """
-        return ListResourcesResponse(id=message.id, result={"resources": []})
+        return ListResourcesResponse.model_construct(id=message.id, result={"resources": []})
 
     async def _handle_list_prompts(self, message: ListPromptsRequest) -> ListPromptsResponse:
         """
@@ -538,7 +601,7 @@ class MCPServer:
         Returns:
             A properly formatted prompts/list response
         """
-        return ListPromptsResponse(id=message.id, result={"prompts": []})
+        return ListPromptsResponse.model_construct(id=message.id, result={"prompts": []})
 
     def _get_auth_requirement(self, tool: MaterializedTool) -> AuthRequirement | None:
         """
@@ -572,6 +635,9 @@ class MCPServer:
         """
         Check if a tool is authorized for a user.
 
+        Completed authorizations are cached for AUTH_CACHE_TTL_SECONDS so that
+        repeated calls to the same tool don't hit Arcade every time.
+
         Args:
             tool: The tool to check authorization for
             user_id: The user ID to check authorization for
@@ -583,16 +649,41 @@ class MCPServer:
             RuntimeError: If the tool has no authorization requirement
             Exception: If authorization fails
         """
+        user_id = user_id or "anonymous"
+        oauth2 = auth_requirement.get("oauth2") or {}
+        cache_key = (
+            auth_requirement.get("provider_id"),
+            auth_requirement.get("provider_type"),
+            user_id,
+            tuple(sorted(oauth2.get("scopes") or ())),
+        )
+
+        cached = self._auth_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < AUTH_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
             response = await self.arcade.auth.authorize(
                 auth_requirement=auth_requirement,
-                user_id=user_id or "anonymous",
+                user_id=user_id,
             )
-            logger.debug(f"Authorization response: {response}")
+            logger.debug("Authorization response: %s", response)
 
         except ArcadeError:
             logger.exception("Error authorizing tool")
             raise
+
+        if response.status == "completed":
+            now = time.monotonic()
+            # Drop expired entries so the cache doesn't grow with every user and scope set
+            expired = [
+                key
+                for key, (cached_at, _) in self._auth_cache.items()
+                if now - cached_at >= AUTH_CACHE_TTL_SECONDS
+            ]
+            for key in expired:
+                del self._auth_cache[key]
+            self._auth_cache[cache_key] = (now, response)
         return response
 
     async def shutdown(self) -> None:
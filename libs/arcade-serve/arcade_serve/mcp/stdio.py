@@ -1,20 +1,23 @@
 import asyncio
 import logging
+import os
 import queue
 import signal
+import stat
 import sys
 import threading
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Any, TypeVar
-
-if TYPE_CHECKING:
-    pass
+from typing import Any
 
 from arcade_serve.mcp.server import MCPServer
 
 logger = logging.getLogger("arcade.mcp")
 
-T = TypeVar("T")
+# Maximum number of already-queued stdin lines taken per read
+READ_BATCH_SIZE = 32
+
+# Maximum number of already-queued responses coalesced into one stdout write
+WRITE_BATCH_SIZE = 32
 
 
 def stdio_reader(stdin: object, q: queue.Queue[str | None]) -> None:
@@ -42,6 +45,47 @@ def stdio_writer(stdout: object, q: queue.Queue[str | None]) -> None:
         logger.exception("Error in stdio writer")
 
 
+class StdinProtocol(asyncio.Protocol):
+    """
+    Reads newline-delimited JSON-RPC messages from a stdin pipe on the event loop.
+
+    Complete lines are pushed onto an asyncio queue as they arrive, followed by
+    None at EOF, so no reader thread or per-line thread hop is needed.
+    """
+
+    def __init__(self, q: asyncio.Queue[str | None]) -> None:
+        self._queue = q
+        self._buffer = bytearray()
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        start = 0
+        try:
+            while (end := self._buffer.find(b"\n", start)) != -1:
+                # Match sys.stdin, which passes undecodable bytes through as surrogates
+                self._queue.put_nowait(
+                    self._buffer[start : end + 1].decode("utf-8", "surrogateescape")
+                )
+                start = end + 1
+        finally:
+            if start:
+                del self._buffer[:start]
+
+    def eof_received(self) -> bool | None:
+        try:
+            if self._buffer:
+                self._queue.put_nowait(self._buffer.decode("utf-8", "surrogateescape"))
+                self._buffer.clear()
+        finally:
+            self._queue.put_nowait(None)
+        return None
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if exc is not None:
+            logger.error("Lost connection to stdin: %s", exc)
+            self._queue.put_nowait(None)
+
+
 class StdioServer(MCPServer):
     """
     Stdio server that handles signals and cleanup.
@@ -61,22 +105,49 @@ class StdioServer(MCPServer):
         super().__init__(tool_catalog, enable_logging, **client_kwargs)
         self.read_q: queue.Queue[str | None] = queue.Queue()
         self.write_q: queue.Queue[str | None] = queue.Queue()
+        self.pipe_q: asyncio.Queue[str | None] | None = None
+        self.pipe_transport: asyncio.ReadTransport | None = None
         self.reader_thread: threading.Thread | None = None
         self.writer_thread: threading.Thread | None = None
         self.running = False
         self.shutdown_event = asyncio.Event()
 
-    def start_io_threads(self) -> None:
+    def start_io_threads(self, read_stdin: bool = True) -> None:
         """Start stdio reader and writer threads."""
-        self.reader_thread = threading.Thread(
-            target=self._stdio_reader, args=(sys.stdin, self.read_q), daemon=True
-        )
+        if read_stdin:
+            self.reader_thread = threading.Thread(
+                target=self._stdio_reader, args=(sys.stdin, self.read_q), daemon=True
+            )
+            self.reader_thread.start()
         self.writer_thread = threading.Thread(
             target=self._stdio_writer, args=(sys.stdout, self.write_q), daemon=True
         )
-        self.reader_thread.start()
         self.writer_thread.start()
 
+    async def connect_stdin_pipe(self) -> bool:
+        """
+        Read stdin with StdinProtocol on the event loop when stdin is a pipe.
+
+        Only pipes are attached: the loop puts the file descriptor in non-blocking
+        mode, which would also affect stdout when both share a terminal.
+
+        Returns:
+            True if stdin is now read by the event loop, False to use a reader thread
+        """
+        try:
+            if not stat.S_ISFIFO(os.fstat(sys.stdin.fileno()).st_mode):
+                return False
+            pipe_q: asyncio.Queue[str | None] = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            self.pipe_transport, _ = await loop.connect_read_pipe(
+                lambda: StdinProtocol(pipe_q), sys.stdin
+            )
+            self.pipe_q = pipe_q
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            logger.debug("Falling back to a stdin reader thread", exc_info=True)
+            return False
+        return True
+
     def _stdio_reader(self, stdin: object, q: queue.Queue[str | None]) -> None:
         """Read lines from stdin and put them into a queue."""
         try:
@@ -96,25 +167,70 @@ class StdioServer(MCPServer):
                 msg = q.get()
                 if msg is None:
                     break
-                stdout.write(msg)  # type: ignore[attr-defined]
+
+                # Coalesce responses that are already queued into a single write and flush
+                batch = [msg]
+                done = False
+                while len(batch) < WRITE_BATCH_SIZE:
+                    try:
+                        msg = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if msg is None:
+                        done = True
+                        break
+                    batch.append(msg)
+
+                stdout.write("".join(batch))  # type: ignore[attr-defined]
                 stdout.flush()  # type: ignore[attr-defined]
+                if done:
+                    break
         except Exception:
             logger.exception("Error in stdio writer")
 
-    async def _read_stream(self) -> AsyncGenerator[str, None]:
-        """Async generator that yields lines from the read queue."""
-        while self.running:
+    def _read_batch(self) -> list[str | None]:
+        """Block for the next line, then take any lines that are already queued."""
+        lines = [self.read_q.get()]
+        while lines[-1] is not None and len(lines) < READ_BATCH_SIZE:
             try:
-                line = await asyncio.to_thread(self.read_q.get)
+                lines.append(self.read_q.get_nowait())
+            except queue.Empty:
+                break
+        return lines
+
+    async def _read_stream(self) -> AsyncGenerator[str, None]:
+        """
+        Async generator that yields lines from stdin.
+
+        Lines come from the stdin pipe protocol when connected. Otherwise lines that
+        arrive together are read from the reader thread's queue in a single
+        worker-thread hop instead of one hop per line.
+        """
+        if self.pipe_q is not None:
+            while self.running:
+                try:
+                    line = await self.pipe_q.get()
+                except asyncio.CancelledError:
+                    break
                 if line is None:
                     break
                 yield line
+            return
+
+        while self.running:
+            try:
+                lines = await asyncio.to_thread(self._read_batch)
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error reading from stdin")
                 break
 
+            for line in lines:
+                if line is None or not self.running:
+                    return
+                yield line
+
     async def shutdown(self) -> None:
         """Gracefully shut down the server."""
         if not self.running:
@@ -128,6 +244,10 @@ class StdioServer(MCPServer):
 
         # Clean up IO queues and threads
         try:
+            if self.pipe_transport:
+                self.pipe_transport.close()
+            if self.pipe_q:
+                self.pipe_q.put_nowait(None)
             if self.read_q:
                 self.read_q.put(None)
             if self.write_q:
@@ -155,16 +275,18 @@ class StdioServer(MCPServer):
                 else:
                     logger.warning(f"Failed to set up signal handler for {sig}")
 
-        # Start IO threads
-        self.start_io_threads()
+        # Read stdin on the event loop when possible, then start the IO threads
+        stdin_connected = await self.connect_stdin_pipe()
+        self.start_io_threads(read_stdin=not stdin_connected)
 
         logger.info("Starting MCP server with stdio transport")
 
         # Create WriteStream class for MCP server
         class WriteStream:
             async def send(self_, message: str) -> None:
+                # The write queue is unbounded, so putting never blocks the event loop
                 if self.running:
-                    await asyncio.to_thread(self.write_q.put, message)
+                    self.write_q.put_nowait(message)
 
         try:
             # Run MCP server connection
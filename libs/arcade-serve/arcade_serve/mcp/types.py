@@ -1,4 +1,3 @@
-import json
 from collections.abc import Callable
 from typing import (
     Any,
@@ -10,6 +9,7 @@ from typing import (
 )
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
 
 ProgressToken = str | int
 Cursor = str
@@ -17,23 +17,28 @@ Role = Literal["user", "assistant"]
 RequestId = str | int
 AnyFunction: TypeAlias = Callable[..., Any]
 
+# Model configs shared by the message types below
+_ALLOW = ConfigDict(extra="allow")
+_FROZEN = ConfigDict(frozen=True)
+_ALLOW_FROZEN = ConfigDict(extra="allow", frozen=True)
+
 
 class RequestParams(BaseModel):
     class Meta(BaseModel):
         progressToken: ProgressToken | None = None
-        model_config = ConfigDict(extra="allow")
+        model_config = _ALLOW
 
     meta: Meta | None = Field(alias="_meta", default=None)
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class NotificationParams(BaseModel):
     class Meta(BaseModel):
-        model_config = ConfigDict(extra="allow")
+        model_config = _ALLOW
 
     meta: Meta | None = Field(alias="_meta", default=None)
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 RequestParamsT = TypeVar("RequestParamsT", bound=RequestParams | dict[str, Any] | None)
@@ -46,34 +51,34 @@ MethodT = TypeVar("MethodT", bound=str)
 class Request(BaseModel, Generic[RequestParamsT, MethodT]):
     method: MethodT
     params: RequestParamsT
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class PaginatedRequest(Request[RequestParamsT, MethodT]):
     cursor: Cursor | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class Notification(BaseModel, Generic[NotificationParamsT, MethodT]):
     method: MethodT
     params: NotificationParamsT
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class Result(BaseModel):
     meta: dict[str, Any] | None = Field(alias="_meta", default=None)
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class PaginatedResult(Result):
     nextCursor: Cursor | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class JSONRPCMessage(BaseModel):
     """Base class for all JSON-RPC messages."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
     jsonrpc: str = Field(default="2.0", frozen=True)
 
 
@@ -119,7 +124,7 @@ class JSONRPCResponse(JSONRPCMessage):
         if self.error is not None:
             data["error"] = self.error  # type: ignore[assignment]
 
-        return json.dumps(data, ensure_ascii=False)
+        return to_json(data).decode()
 
 
 class JSONRPCError(JSONRPCMessage):
@@ -140,7 +145,7 @@ class ErrorData(BaseModel):
     code: int
     message: str
     data: Any | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 JSONRPCMessageBaseModel = BaseModel | JSONRPCRequest | JSONRPCResponse | JSONRPCError
@@ -155,49 +160,49 @@ class Implementation(BaseModel):
 
     name: str
     version: str
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW_FROZEN
 
 
 class RootsCapability(BaseModel):
     listChanged: bool | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class SamplingCapability(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class ClientCapabilities(BaseModel):
     experimental: dict[str, dict[str, Any]] | None = None
     sampling: SamplingCapability | None = None
     roots: RootsCapability | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class PromptsCapability(BaseModel):
     listChanged: bool | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class ResourcesCapability(BaseModel):
     subscribe: bool | None = None
     listChanged: bool | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class ToolsCapability(BaseModel):
     listChanged: bool | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class LoggingCapability(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class ServerCapabilities(BaseModel):
     """Describes the server's capabilities."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW_FROZEN
     tools: dict[str, Any] | None = None
     resources: dict[str, Any] | None = None
     prompts: dict[str, Any] | None = None
@@ -207,7 +212,7 @@ class InitializeRequestParams(RequestParams):
     protocolVersion: str | int
     capabilities: ClientCapabilities
     clientInfo: Implementation
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class InitializeRequest(JSONRPCRequest):
@@ -220,6 +225,7 @@ class InitializeResult(BaseModel):
     capabilities: ServerCapabilities
     serverInfo: Implementation
     instructions: str | None = None
+    model_config = _FROZEN
 
 
 class InitializedNotification(
@@ -227,7 +233,7 @@ class InitializedNotification(
 ):
     method: Literal["notifications/initialized"]
     params: NotificationParams | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW
 
 
 class PingRequest(JSONRPCRequest):
@@ -239,7 +245,7 @@ class ProgressNotificationParams(NotificationParams):
     progressToken: ProgressToken
     progress: float
     total: float | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW_FROZEN
 
 
 class ProgressNotification(JSONRPCMessage):
@@ -285,7 +291,7 @@ class InitializeResponse(JSONRPCResponse):
         }
 
         # Return JSON string
-        return json.dumps(data, ensure_ascii=False)
+        return to_json(data).decode()
 
 
 class ListToolsRequest(JSONRPCRequest):
@@ -303,7 +309,7 @@ class ToolAnnotations(BaseModel):
     destructiveHint: bool | None = None
     idempotentHint: bool | None = None
     openWorldHint: bool | None = None
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW_FROZEN
 
 
 class Tool(BaseModel):
@@ -316,7 +322,7 @@ class Tool(BaseModel):
     inputSchema: dict[str, Any] | None = None
     annotations: ToolAnnotations | None = None
 
-    model_config = ConfigDict(extra="allow")
+    model_config = _ALLOW_FROZEN
 
 
 class ListToolsResult(BaseModel):
@@ -334,11 +340,25 @@ class CallToolRequest(JSONRPCRequest):
 
 class CallToolResult(BaseModel):
     content: Any
+    model_config = _FROZEN
 
 
 class CallToolResponse(JSONRPCResponse):
     result: CallToolResult
 
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Convert to JSON string with proper formatting."""
+        # The content blocks are already plain JSON-compatible dicts whose text holds
+        # the serialized tool output, so they are emitted as-is instead of being walked
+        # again by model_dump() before the final to_json().
+        data = {
+            "jsonrpc": self.jsonrpc,
+            "id": self.id,
+            "result": {"content": self.result.content},
+        }
+
+        return to_json(data).decode()
+
 
 # Resource and Prompt protocol stubs (expand as needed)
 class ListResourcesRequest(JSONRPCRequest):
@@ -0,0 +1,22 @@
+import logging
+
+import pytest
+from arcade_serve.mcp.logging import MCPLoggingMiddleware
+
+
+@pytest.mark.parametrize(
+    "level_name,expected",
+    [
+        ("INFO", logging.INFO),
+        ("debug", logging.DEBUG),
+        ("NOTSET", logging.NOTSET),
+        ("notice", logging.INFO),
+    ],
+)
+def test_logging_middleware_accepts_python_and_mcp_levels(level_name, expected):
+    assert MCPLoggingMiddleware(log_level=level_name).log_level == expected
+
+
+def test_logging_middleware_rejects_unknown_level():
+    with pytest.raises(ValueError, match="Unknown log level"):
+        MCPLoggingMiddleware(log_level="verbose")
@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 from arcade_serve.mcp.message_processor import MCPMessageProcessor, create_message_processor
-from arcade_serve.mcp.types import InitializeRequest, PingRequest
+from arcade_serve.mcp.types import CallToolRequest, InitializeRequest, JSONRPCRequest, PingRequest
 
 
 @pytest.mark.asyncio
@@ -54,3 +54,72 @@ async def test_message_processor_middleware_execution_order(monkeypatch):
     _ = await processor.process_request(ping)
 
     assert order == ["sync", "async"]
+
+
+@pytest.mark.asyncio
+async def test_message_processor_middleware_changes_after_construction():
+    """Middleware removed from or added to the processor later should take effect."""
+
+    order: list[str] = []
+
+    def mw_first(msg, direction):  # type: ignore[return-value]
+        order.append("first")
+        return msg
+
+    async def mw_second(msg, direction):  # type: ignore[return-value]
+        order.append("second")
+        return msg
+
+    processor = create_message_processor(mw_first)
+    processor.middleware.clear()
+    processor.add_middleware(mw_second)
+
+    _ = await processor.process_request(PingRequest(id=42))
+
+    assert order == ["second"]
+    assert processor.middleware == [(mw_second, True)]
+
+
+@pytest.mark.asyncio
+async def test_message_processor_passes_invalid_json_through():
+    """Messages that are not valid JSON should be passed through as stripped strings."""
+    processor = MCPMessageProcessor()
+
+    result = await processor.process_request("{not json\n")
+
+    assert result == "{not json"
+
+
+@pytest.mark.asyncio
+async def test_message_processor_passes_undecodable_text_through():
+    """Undecodable stdin bytes arrive as surrogates and should pass through unparsed."""
+    processor = MCPMessageProcessor()
+
+    result = await processor.process_request("\udcff\udcfe bad\n")
+
+    assert result == "\udcff\udcfe bad"
+
+
+@pytest.mark.asyncio
+async def test_message_processor_types_requests_by_method():
+    """Known request methods should be parsed into their specific request models."""
+    processor = MCPMessageProcessor()
+
+    result = await processor.process_request(
+        '{"jsonrpc":"2.0","id":2,"method":"tools/call","params":{"name":"Math_Add"}}'
+    )
+
+    assert isinstance(result, CallToolRequest)
+    assert result.params == {"name": "Math_Add"}
+
+
+@pytest.mark.asyncio
+async def test_message_processor_falls_back_for_request_missing_params():
+    """A request that fails its method's stricter model is still parsed as a request."""
+    processor = MCPMessageProcessor()
+
+    result = await processor.process_request('{"jsonrpc":"2.0","id":1,"method":"$/cancelRequest"}')
+
+    assert type(result) is JSONRPCRequest
+    assert result.method == "$/cancelRequest"
+    assert result.id == 1
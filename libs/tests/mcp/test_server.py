@@ -1,3 +1,4 @@
+import json
 import sys
 import types
 from typing import Annotated, Any
@@ -9,6 +10,7 @@ from arcade_serve.mcp.types import (
     CallToolRequest,
     CancelRequest,
     InitializeRequest,
+    ListResourcesRequest,
     ListToolsRequest,
     PingRequest,
 )
@@ -98,6 +100,20 @@ async def test_handle_ping(server):
     resp = await server._handle_ping(req)  # pylint: disable=protected-access
     assert resp.id == 123
     assert resp.result == {"pong": True}
+    assert json.loads(resp.model_dump_json()) == {
+        "jsonrpc": "2.0",
+        "id": 123,
+        "result": {"pong": True},
+    }
+
+
+async def test_stub_results_are_not_shared(server):
+    req = ListResourcesRequest(id=1)
+    first = await server._handle_list_resources(req)  # pylint: disable=protected-access
+    first.result["resources"].append({"uri": "file:///leak"})
+
+    second = await server._handle_list_resources(req)  # pylint: disable=protected-access
+    assert second.result == {"resources": []}
 
 
 async def test_handle_initialize(server):
@@ -150,3 +166,138 @@ async def test_handle_cancel(server):
     req = CancelRequest(id=77, params={"id": "abc"})
     resp = await server._handle_cancel(req)  # pylint: disable=protected-access
     assert resp.result == {"ok": True}
+
+
+async def test_check_authorization_is_cached(server):
+    calls: list[str] = []
+    original_authorize = server.arcade.auth.authorize
+
+    async def _counting_authorize(auth_requirement: Any, user_id: str):
+        calls.append(user_id)
+        return await original_authorize(auth_requirement, user_id)
+
+    server.arcade.auth.authorize = _counting_authorize
+    requirement = {"provider_id": "google", "provider_type": "oauth2", "oauth2": {"scopes": ["a"]}}
+
+    first = await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    second = await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    assert first is second
+    assert calls == ["u1"]
+
+    # A different user is a different cache entry
+    await server._check_authorization(requirement, user_id="u2")  # pylint: disable=protected-access
+    assert calls == ["u1", "u2"]
+
+
+async def test_check_authorization_does_not_cache_pending(server):
+    calls: list[str] = []
+
+    class _PendingResp:  # pylint: disable=too-few-public-methods
+        status = "pending"
+        url = "https://example.com/authorize"
+
+    async def _pending_authorize(auth_requirement: Any, user_id: str):
+        calls.append(user_id)
+        return _PendingResp()
+
+    server.arcade.auth.authorize = _pending_authorize
+    requirement = {"provider_id": "google", "provider_type": "oauth2", "oauth2": {"scopes": ["a"]}}
+
+    await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    assert calls == ["u1", "u1"]
+    assert server._auth_cache == {}  # pylint: disable=protected-access
+
+
+async def test_check_authorization_expires_cached_entries(server):
+    calls: list[str] = []
+    original_authorize = server.arcade.auth.authorize
+
+    async def _counting_authorize(auth_requirement: Any, user_id: str):
+        calls.append(user_id)
+        return await original_authorize(auth_requirement, user_id)
+
+    server.arcade.auth.authorize = _counting_authorize
+    requirement = {"provider_id": "google", "provider_type": "oauth2", "oauth2": {"scopes": ["a"]}}
+    auth_cache = server._auth_cache  # pylint: disable=protected-access
+
+    await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    await server._check_authorization(requirement, user_id="u2")  # pylint: disable=protected-access
+    # Age both entries past the TTL
+    for key, (cached_at, response) in list(auth_cache.items()):
+        auth_cache[key] = (cached_at - mcp_server.AUTH_CACHE_TTL_SECONDS - 1, response)
+
+    await server._check_authorization(requirement, user_id="u1")  # pylint: disable=protected-access
+    assert calls == ["u1", "u2", "u1"]
+    # The expired entry for u2 is pruned when u1's fresh authorization is stored
+    assert [key[2] for key in server._auth_cache] == ["u1"]  # pylint: disable=protected-access
+
+
+async def test_call_tool_response_serialization(server):
+    req = CallToolRequest(
+        id="call-2",
+        params={"name": "TestToolkit_Multiply", "input": {"a": 2, "b": 3}},
+    )
+    resp = await server._handle_call_tool(req, user_id="tester@example.com")  # pylint: disable=protected-access
+
+    assert json.loads(resp.model_dump_json()) == {
+        "jsonrpc": "2.0",
+        "id": "call-2",
+        "result": {"content": [{"type": "text", "text": "6"}]},
+    }
+
+
+async def test_get_user_id_precedence(server, monkeypatch):
+    monkeypatch.setattr(server, "_config_user_id", "config@example.com")
+
+    monkeypatch.setenv("ARCADE_USER_ID", "env-user")
+    assert server._get_user_id({"user_id": "opt-user"}) == "env-user"  # pylint: disable=protected-access
+
+    monkeypatch.delenv("ARCADE_USER_ID")
+    assert server._get_user_id({"user_id": "opt-user"}) == "opt-user"  # pylint: disable=protected-access
+    assert server._get_user_id(None) == "config@example.com"  # pylint: disable=protected-access
+
+    monkeypatch.setattr(server, "_config_user_id", None)
+    assert server._get_user_id(None) != server._get_user_id(None)  # pylint: disable=protected-access
+
+
+async def test_setup_tool_secrets_from_env(server, monkeypatch):
+    from arcade_core.schema import ToolContext
+
+    secret_reqs = [types.SimpleNamespace(key="API_KEY"), types.SimpleNamespace(key="MISSING")]
+    fake_tool = types.SimpleNamespace(
+        definition=types.SimpleNamespace(
+            requirements=types.SimpleNamespace(secrets=secret_reqs),
+        )
+    )
+    monkeypatch.setenv("API_KEY", "secret-value")
+    monkeypatch.delenv("MISSING", raising=False)
+
+    context = ToolContext()
+    server._setup_tool_secrets(fake_tool, context)  # pylint: disable=protected-access
+
+    assert context.get_secret("API_KEY") == "secret-value"
+    assert [s.key for s in context.secrets] == ["API_KEY"]
+
+
+async def test_handle_message_notification_is_not_echoed(server):
+    message = '{"jsonrpc":"2.0","method":"notifications/initialized"}\n'
+    assert await server.handle_message(message) is None
+
+
+async def test_handle_message_dispatches_ping(server):
+    resp = await server.handle_message('{"jsonrpc":"2.0","id":5,"method":"ping"}\n')
+    assert resp.id == 5
+    assert resp.result == {"pong": True}
+
+
+async def test_handle_message_unknown_method(server):
+    resp = await server.handle_message('{"jsonrpc":"2.0","id":6,"method":"bogus/method"}\n')
+    assert resp.id == 6
+    assert resp.error["code"] == -32601
+
+
+async def test_handle_message_cancel_without_params(server):
+    resp = await server.handle_message('{"jsonrpc":"2.0","id":7,"method":"$/cancelRequest"}\n')
+    assert resp.id == 7
+    assert resp.result == {"ok": True}
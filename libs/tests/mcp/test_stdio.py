@@ -1,7 +1,18 @@
+import asyncio
 import io
 import queue
 
-from arcade_serve.mcp.stdio import stdio_reader, stdio_writer
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_serve.mcp.stdio import StdinProtocol, StdioServer, stdio_reader, stdio_writer
+
+
+@pytest.fixture
+def stdio_server(monkeypatch):
+    monkeypatch.setenv("ARCADE_API_KEY", "test-key")
+    server = StdioServer(ToolCatalog(), enable_logging=False)
+    server.running = True
+    return server
 
 
 def test_stdio_reader_puts_lines_and_none():
@@ -30,3 +41,68 @@ def test_stdio_writer_reads_until_none():
     # Ensure writer appended newlines when missing
     output_stream.seek(0)
     assert output_stream.read() == "msg1\nmsg2\n"
+
+
+def test_server_writer_coalesces_queued_messages(stdio_server):
+    server = stdio_server
+
+    class CountingStream(io.StringIO):
+        flushes = 0
+
+        def flush(self) -> None:
+            self.flushes += 1
+
+    for msg in ("msg1\n", "msg2\n", "msg3\n", None):
+        server.write_q.put(msg)
+    output_stream = CountingStream()
+
+    server._stdio_writer(output_stream, server.write_q)  # pylint: disable=protected-access
+
+    assert output_stream.getvalue() == "msg1\nmsg2\nmsg3\n"
+    assert output_stream.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_read_stream_drains_queued_lines(stdio_server, monkeypatch):
+    server = stdio_server
+    hops = 0
+    to_thread = asyncio.to_thread
+
+    async def _counting_to_thread(func, /, *args, **kwargs):
+        nonlocal hops
+        hops += 1
+        return await to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", _counting_to_thread)
+    for line in ("line1\n", "line2\n", "line3\n", None):
+        server.read_q.put(line)
+
+    lines = [line async for line in server._read_stream()]  # pylint: disable=protected-access
+
+    assert lines == ["line1\n", "line2\n", "line3\n"]
+    # All queued lines and the sentinel are taken in a single thread hop
+    assert hops == 1
+
+
+def test_stdin_protocol_frames_lines_across_chunks():
+    q: asyncio.Queue[str | None] = asyncio.Queue()
+    protocol = StdinProtocol(q)
+
+    protocol.data_received(b'{"id": 1}\n{"id"')
+    protocol.data_received(b': 2}\n{"id": 3}')
+    protocol.eof_received()
+
+    assert [q.get_nowait() for _ in range(4)] == ['{"id": 1}\n', '{"id": 2}\n', '{"id": 3}', None]
+
+
+def test_stdin_protocol_passes_invalid_utf8_through():
+    q: asyncio.Queue[str | None] = asyncio.Queue()
+    protocol = StdinProtocol(q)
+
+    protocol.data_received(b'{"id": 1}\n\xff\xfe bad\n{"id": 2}\n')
+    protocol.eof_received()
+
+    lines = [q.get_nowait() for _ in range(4)]
+    assert lines[0] == '{"id": 1}\n'
+    assert lines[1] == "\udcff\udcfe bad\n"
+    assert lines[2:] == ['{"id": 2}\n', None]
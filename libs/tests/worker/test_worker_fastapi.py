@@ -26,38 +26,35 @@ def error_throwing_tool(
     raise ValueError("Test execution error")
 
 
-@pytest.fixture
-def test_app():
-    return FastAPI()
-
-
-@pytest.fixture
+# The apps, workers and clients are not modified by the tests, so they are built
+# once per module. Each worker gets its own app so their routes don't collide.
+@pytest.fixture(scope="module")
 def worker_secret():
     return "test-secret-fastapi"
 
 
-@pytest.fixture
-def fastapi_worker(test_app, worker_secret):
-    worker = FastAPIWorker(app=test_app, secret=worker_secret)
+@pytest.fixture(scope="module")
+def fastapi_worker(worker_secret):
+    worker = FastAPIWorker(app=FastAPI(), secret=worker_secret)
     worker.register_tool(sample_tool_fastapi, toolkit_name="fastapi_kit")
     return worker
 
 
-@pytest.fixture
-def fastapi_worker_no_auth(test_app):
-    worker = FastAPIWorker(app=test_app, disable_auth=True)
+@pytest.fixture(scope="module")
+def fastapi_worker_no_auth():
+    worker = FastAPIWorker(app=FastAPI(), disable_auth=True)
     worker.register_tool(sample_tool_fastapi, toolkit_name="fastapi_kit")
     return worker
 
 
-@pytest.fixture
-def client(test_app, fastapi_worker):  # Use the worker fixture to ensure routes are registered
-    return TestClient(test_app)
+@pytest.fixture(scope="module")
+def client(fastapi_worker):
+    return TestClient(fastapi_worker.app)
 
 
-@pytest.fixture
-def client_no_auth(test_app, fastapi_worker_no_auth):
-    return TestClient(test_app)
+@pytest.fixture(scope="module")
+def client_no_auth(fastapi_worker_no_auth):
+    return TestClient(fastapi_worker_no_auth.app)
 
 
 # --- FastAPIWorker Tests ---
@@ -1,3 +1,5 @@
+import logging
+import re
 from typing import Annotated, Any
 
 from arcade_tdk import ToolContext, tool
@@ -5,6 +7,12 @@ from arcade_tdk.errors import RetryableToolError
 
 from ..database_engine import MAX_ROWS_RETURNED, DatabaseEngine
 
+logger = logging.getLogger(__name__)
+
+# Key clauses of a CREATE TABLE statement that name primary key columns
+_PRIMARY_KEY_RE = re.compile(r"PRIMARY KEY\s*\(([^)]+)\)", re.IGNORECASE)
+_ORDER_BY_RE = re.compile(r"ORDER BY\s*\(([^)]+)\)", re.IGNORECASE)
+
 
 @tool(requires_secrets=["CLICKHOUSE_DATABASE_CONNECTION_STRING"])
 async def discover_schemas(
@@ -232,16 +240,14 @@ def _extract_primary_keys_from_create_statement(create_statement: str) -> set[st
     primary_keys = set()
 
     # Look for PRIMARY KEY clause
-    import re
-
-    pk_match = re.search(r"PRIMARY KEY\s*\(([^)]+)\)", create_statement, re.IGNORECASE)
+    pk_match = _PRIMARY_KEY_RE.search(create_statement)
     if pk_match:
         pk_columns = pk_match.group(1).split(",")
         for col in pk_columns:
             primary_keys.add(col.strip().strip("`"))
 
     # Look for ORDER BY clause (which can also indicate primary key)
-    order_match = re.search(r"ORDER BY\s*\(([^)]+)\)", create_statement, re.IGNORECASE)
+    order_match = _ORDER_BY_RE.search(create_statement)
     if order_match:
         order_columns = order_match.group(1).split(",")
         for col in order_columns:
@@ -276,8 +282,8 @@ async def _execute_query(
         order_by_clause=order_by_clause,
         with_clause=with_clause,
     )
-    print(f"Query: {query}")
-    print(f"Parameters: {parameters}")
+    logger.debug("Query: %s", query)
+    logger.debug("Parameters: %s", parameters)
 
     # For clickhouse-connect, we need to substitute parameters manually
     # since it doesn't use SQLAlchemy-style parameter binding
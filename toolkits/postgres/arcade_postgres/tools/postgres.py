@@ -1,3 +1,4 @@
+import logging
 from typing import Annotated, Any
 
 from arcade_tdk import ToolContext, tool
@@ -7,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ..database_engine import MAX_ROWS_RETURNED, DatabaseEngine
 
+logger = logging.getLogger(__name__)
+
 
 @tool(requires_secrets=["POSTGRES_DATABASE_CONNECTION_STRING"])
 async def discover_schemas(
@@ -247,8 +250,8 @@ async def _execute_query(
             order_by_clause=order_by_clause,
             with_clause=with_clause,
         )
-        print(f"Query: {query}")
-        print(f"Parameters: {parameters}")
+        logger.debug("Query: %s", query)
+        logger.debug("Parameters: %s", parameters)
         result = await connection.execute(text(query), parameters)
         rows = result.fetchall()
         results = [str(row) for row in rows]
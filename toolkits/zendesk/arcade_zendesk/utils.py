@@ -1,11 +1,10 @@
 import logging
-import re
+from html.parser import HTMLParser
 from typing import Any
 
 import httpx
 from arcade_tdk import ToolContext
 from arcade_tdk.errors import ToolExecutionError
-from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
@@ -106,21 +105,63 @@ async def fetch_paginated_results(
     return result
 
 
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the text content of an HTML document without building a tree."""
+
+    # Tags whose content is not text shown to the reader
+    _SKIPPED_TAGS = frozenset(("script", "style", "template"))
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        # Markup separates text, but text split only by the tokenizer is kept whole
+        self.parts.append(" ")
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self.parts.append(" ")
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self.parts.append(" ")
+
+    def handle_decl(self, decl: str) -> None:
+        self.parts.append(" ")
+
+    def handle_pi(self, data: str) -> None:
+        self.parts.append(" ")
+
+    def unknown_decl(self, data: str) -> None:
+        self.parts.append(" ")
+        if data.startswith("CDATA["):
+            self.handle_data(data[6:])
+            self.parts.append(" ")
+
+
 def clean_html_text(text: str | None) -> str:
     """Remove HTML tags and clean up text."""
     if not text:
         return ""
 
-    soup = BeautifulSoup(text, "html.parser")
-    clean_text: str = soup.get_text(separator=" ")
-
-    clean_text = re.sub(r"\n+", "\n", clean_text)
+    # Text without tags or character references has nothing to parse
+    if "<" not in text and "&" not in text:
+        return " ".join(text.split())
 
-    clean_text = re.sub(r"\s+", " ", clean_text)
+    parser = _HTMLTextExtractor()
+    parser.feed(text)
+    parser.close()
 
-    clean_text = "\n".join(line.strip() for line in clean_text.split("\n"))
-
-    return clean_text.strip()
+    # Collapse every run of whitespace, line breaks included, into a single space
+    return " ".join("".join(parser.parts).split())
 
 
 def truncate_text(
@@ -166,13 +207,8 @@ def process_search_results(
         if include_body and body_content:
             cleaned_content = process_article_body(body_content, max_body_length)
 
-        processed_result: dict[str, Any] = {"content": cleaned_content, "metadata": {}}
-
-        for key, value in result.items():
-            if key != "body":
-                processed_result["metadata"][key] = value
-
-        processed_results.append(processed_result)
+        metadata = {key: value for key, value in result.items() if key != "body"}
+        processed_results.append({"content": cleaned_content, "metadata": metadata})
 
     return processed_results
 
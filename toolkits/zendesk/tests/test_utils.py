@@ -59,6 +59,28 @@ class TestCleanHtmlText:
         """Test edge cases for HTML cleaning."""
         assert clean_html_text(input_value) == expected
 
+    def test_clean_html_skips_script_and_style(self):
+        """Test that script and style content is not returned as text."""
+        html = "<style>p { color: red; }</style><p>Visible</p><script>var x = 1;</script>"
+        assert clean_html_text(html) == "Visible"
+
+    @pytest.mark.parametrize(
+        "input_value,expected",
+        [
+            ("x<y", "x<y"),
+            ("a<3 b", "a<3 b"),
+            ("1 < 2 and 3 > 2", "1 < 2 and 3 > 2"),
+            ("AT&T<br>next", "AT&T next"),
+        ],
+    )
+    def test_clean_html_keeps_stray_angle_brackets_in_text(self, input_value, expected):
+        """Test that a '<' that does not start a tag stays part of the text."""
+        assert clean_html_text(input_value) == expected
+
+    def test_clean_plain_text(self):
+        """Test that text without markup is only whitespace-normalized."""
+        assert clean_html_text("  Plain\n\n text\tbody ") == "Plain text body"
+
     def test_clean_html_preserves_line_breaks(self):
         """Test that meaningful line breaks are preserved."""
         html = "<p>Line 1</p><p>Line 2</p>"